@@ -77,17 +77,23 @@ ensure_dir() { [[ -d "$1" ]] || mkdir -p "$1" 2>/dev/null || true; }
 
 rotate_log() {
     if [[ -f "$LOG_FILE" ]]; then
-        local size_kb
-        size_kb=$(du -k "$LOG_FILE" 2>/dev/null | cut -f1 || echo "0")
-        if [[ "${size_kb:-0}" -gt $(( MAX_LOG_SIZE_MB * 1024 )) ]]; then
+        local size
+        size=$(stat -c%s "$LOG_FILE" 2>/dev/null || echo "0")
+        if [[ "${size:-0}" -gt $(( MAX_LOG_SIZE_MB * 1024 * 1024 )) ]]; then
             mv "$LOG_FILE" "${LOG_FILE}.old" 2>/dev/null || true
         fi
     fi
 }
 
+# Timestamps use bash's printf %(...)T builtin and the log dir is resolved
+# once, so logging doesn't fork date/dirname for every message.
+LOG_DIR="${LOG_FILE%/*}"
+
 log_file() {
-    ensure_dir "$(dirname "$LOG_FILE")"
-    echo "[$(date '+%Y-%m-%d %H:%M:%S')] [$1] $2" >> "$LOG_FILE" 2>/dev/null || true
+    ensure_dir "$LOG_DIR"
+    local ts
+    printf -v ts '%(%Y-%m-%d %H:%M:%S)T' -1
+    echo "[$ts] [$1] $2" >> "$LOG_FILE" 2>/dev/null || true
 }
 
 status() {
@@ -105,7 +111,9 @@ status() {
     esac
     log_file "$level" "$1"
     if ! $SILENT_MODE || [[ "$level" == "ERROR" ]] || [[ "$level" == "OK" ]]; then
-        echo -e "${DIM}[$(date '+%H:%M:%S')]${NC} ${color}${1}${NC}"
+        local ts
+        printf -v ts '%(%H:%M:%S)T' -1
+        echo -e "${DIM}[$ts]${NC} ${color}${1}${NC}"
     fi
 }
 
@@ -195,6 +203,10 @@ declare -a CLIENT_VERSIONS=()
 declare -a CLIENT_PROCESS_NAMES=()
 declare -a CLIENT_NODE_HASHES=()
 declare -a CLIENT_NODE_SIZES=()
+declare -a CLIENT_NODE_MTIMES=()
+
+# Set by download_voice_files: true only when every listed file arrived
+DOWNLOAD_COMPLETE=false
 
 # Search paths and labels
 declare -a SEARCH_PATHS=(
@@ -262,8 +274,25 @@ find_voice_module() {
         done <<< "$app_dirs"
     fi
 
-    # Pattern 2: Direct search for discord_voice.node
+    # Pattern 2: Versioned module folders (<version>/modules/discord_voice*/),
+    # probed by glob so the config dir's Cache/IndexedDB trees aren't walked
     local node_file
+    local -a probed=()
+    local nullglob_state
+    nullglob_state=$(shopt -p nullglob || true)
+    shopt -s nullglob
+    probed=(
+        "$base"/*/modules/discord_voice*/discord_voice/discord_voice.node
+        "$base"/*/modules/discord_voice*/discord_voice.node
+    )
+    eval "$nullglob_state"
+    if [[ ${#probed[@]} -gt 0 ]]; then
+        node_file=$(printf '%s\n' "${probed[@]}" | sort -V -r | head -1)
+        echo "${node_file%/*}|$base"
+        return 0
+    fi
+
+    # Pattern 3: Direct search for discord_voice.node
     node_file=$(find "$base" -maxdepth 6 -name "discord_voice.node" -type f 2>/dev/null | head -1 || true)
     if [[ -n "$node_file" ]]; then
         local voice_dir
@@ -285,17 +314,32 @@ get_app_version() {
 }
 
 # Get .node file hash and size for a voice path
+# Pass "nohash" as 2nd arg to skip the md5 (hash field is left empty)
 get_node_info() {
-    local voice_path="$1"
+    local voice_path="$1" mode="${2:-}"
     local node_file
     node_file=$(find "$voice_path" -name "*.node" -type f 2>/dev/null | head -1 || true)
     if [[ -n "$node_file" ]]; then
-        local hash size
-        hash=$(md5sum "$node_file" 2>/dev/null | cut -d' ' -f1 || true)
-        size=$(stat -c%s "$node_file" 2>/dev/null || echo "0")
-        echo "${hash}|${size}"
+        local hash="" stamp
+        if [[ "$mode" != "nohash" ]]; then
+            hash=$(md5sum "$node_file" 2>/dev/null | cut -d' ' -f1 || true)
+        fi
+        # Size and mtime let later steps tell if the hash is still current
+        stamp=$(stat -c '%s|%.9Y' "$node_file" 2>/dev/null || echo "0|")
+        echo "${hash}|${stamp}"
     else
-        echo "|0"
+        echo "|0|"
+    fi
+}
+
+# Scan-time hash of client $1's node, but only while $2 still has the size
+# and mtime it had when hashed (Discord may have swapped the module since);
+# prints nothing otherwise so the caller re-hashes
+cached_node_hash() {
+    local i="$1" node_file="$2" stamp
+    stamp=$(stat -c '%s|%.9Y' "$node_file" 2>/dev/null || true)
+    if [[ -n "${CLIENT_NODE_HASHES[$i]}" && "$stamp" == "${CLIENT_NODE_SIZES[$i]}|${CLIENT_NODE_MTIMES[$i]}" ]]; then
+        echo "${CLIENT_NODE_HASHES[$i]}"
     fi
 }
 
@@ -308,6 +352,7 @@ find_discord_clients() {
     CLIENT_PROCESS_NAMES=()
     CLIENT_NODE_HASHES=()
     CLIENT_NODE_SIZES=()
+    CLIENT_NODE_MTIMES=()
 
     local found_voice_paths=()
 
@@ -335,11 +380,15 @@ find_discord_clients() {
             local version
             version=$(get_app_version "$app_path")
 
-            # Get node file info
-            local node_info hash size
-            node_info=$(get_node_info "$voice_path")
-            hash="${node_info%%|*}"
-            size="${node_info##*|}"
+            # Get node file info (--check only compares versions against
+            # state.json, so skip hashing the module there)
+            local node_info hash size mtime
+            if $CHECK_ONLY; then
+                node_info=$(get_node_info "$voice_path" nohash)
+            else
+                node_info=$(get_node_info "$voice_path")
+            fi
+            IFS='|' read -r hash size mtime <<< "$node_info"
 
             CLIENT_NAMES+=("$name")
             CLIENT_PATHS+=("$base")
@@ -349,6 +398,7 @@ find_discord_clients() {
             CLIENT_PROCESS_NAMES+=("$proc")
             CLIENT_NODE_HASHES+=("$hash")
             CLIENT_NODE_SIZES+=("$size")
+            CLIENT_NODE_MTIMES+=("$mtime")
             found_voice_paths+=("$voice_path")
 
             log_file "INFO" "Found: $name v$version at $voice_path (hash=${hash:0:8}..., ${size} bytes)"
@@ -359,48 +409,45 @@ find_discord_clients() {
 }
 
 # --- Process Management ------------------------------------------------------
+# Poll (0.1s steps) until no process matches $1, for at most $2 seconds
+wait_for_exit() {
+    local pattern="$1" steps=$(( $2 * 10 )) i
+    for (( i=0; i<steps; i++ )); do
+        pgrep -f "$pattern" &>/dev/null || return 0
+        sleep 0.1
+    done
+    return 1
+}
+
 kill_discord() {
-    local procs=("Discord" "DiscordCanary" "DiscordPTB" "DiscordDevelopment" "discord")
+    # One ERE alternation per pgrep/pkill instead of one process per name
+    local procs="Discord|DiscordCanary|DiscordPTB|DiscordDevelopment|discord"
     local attempts=0 max_attempts=3
 
     while [[ $attempts -lt $max_attempts ]]; do
-        local running=false
-        for pname in "${procs[@]}"; do
-            if pgrep -f "$pname" &>/dev/null; then
-                running=true
-                break
-            fi
-        done
-
-        if ! $running; then
+        if ! pgrep -f "$procs" &>/dev/null; then
             return 0
         fi
 
         if [[ $attempts -eq 0 ]]; then
             # Graceful SIGTERM first
-            for pname in "${procs[@]}"; do
-                pkill -f "$pname" 2>/dev/null || true
-            done
-            sleep 2
+            pkill -f "$procs" 2>/dev/null || true
+            wait_for_exit "$procs" 2 || true
         else
             # Force SIGKILL
-            for pname in "${procs[@]}"; do
-                pkill -9 -f "$pname" 2>/dev/null || true
-            done
-            sleep 1
+            pkill -9 -f "$procs" 2>/dev/null || true
+            wait_for_exit "$procs" 1 || true
         fi
 
         (( attempts++ )) || true
     done
 
     # Final check
-    for pname in "${procs[@]}"; do
-        if pgrep -f "$pname" &>/dev/null; then
-            status "  [!] Warning: Could not kill all Discord processes" orange
-            log_file "WARN" "Discord processes still running after $max_attempts kill attempts"
-            return 1
-        fi
-    done
+    if pgrep -f "$procs" &>/dev/null; then
+        status "  [!] Warning: Could not kill all Discord processes" orange
+        log_file "WARN" "Discord processes still running after $max_attempts kill attempts"
+        return 1
+    fi
 
     return 0
 }
@@ -550,13 +597,13 @@ validate_backup_integrity() {
         return
     fi
 
-    if ! jq empty "$meta" 2>/dev/null; then
+    # One jq pass both parses the file and reads ClientName
+    local cn
+    if ! cn=$(jq -r '.ClientName // empty' "$meta" 2>/dev/null); then
         echo "INVALID|Corrupted metadata.json"
         return
     fi
 
-    local cn
-    cn=$(jq -r '.ClientName // empty' "$meta" 2>/dev/null || true)
     if [[ -z "$cn" ]]; then
         echo "INVALID|Missing ClientName in metadata"
         return
@@ -571,6 +618,14 @@ validate_backup_integrity() {
 }
 
 # --- Backup Management ------------------------------------------------------
+# cp -r that makes copy-on-write clones where the filesystem supports it
+# (btrfs/XFS reflinks), so ~115MB module copies share extents instead of
+# duplicating data; --reflink=auto itself copies normally elsewhere, so a
+# failure here is a real error (ENOSPC, EACCES) and is left to surface
+clone_copy() {
+    cp -r --reflink=auto "$@"
+}
+
 create_original_backup() {
     local voice_path="$1" client_name="$2" version="$3"
     local sname
@@ -612,7 +667,7 @@ create_original_backup() {
 
     ensure_dir "$backup_path/voice_module"
     status "  Creating ORIGINAL backup (will never be deleted)..." magenta
-    cp -r "$voice_path"/* "$backup_path/voice_module/" 2>/dev/null
+    clone_copy "$voice_path"/* "$backup_path/voice_module/" 2>/dev/null
 
     if ! backup_has_content "$backup_path"; then
         status "  [!] Backup validation failed - files may be corrupted" orange
@@ -670,9 +725,26 @@ create_voice_backup() {
         return 1
     fi
 
+    # Newest backup of this client already holds this exact module (e.g.
+    # re-fixing right after a restore): another identical copy adds nothing.
+    # "Identical" means the whole folder - every file byte-for-byte, none
+    # missing or extra - not just the .node, since the backup copies it all.
+    local dir cn
+    while IFS= read -r dir; do
+        cn=$(jq -r '.ClientName // empty' "$dir/metadata.json" 2>/dev/null || true)
+        [[ "$cn" == "$client_name" ]] || continue
+        if backup_has_content "$dir" && diff -rq "$dir/voice_module" "$voice_path" &>/dev/null; then
+            dir="${dir%/}"
+            status "  [OK] Latest backup already matches current module: ${dir##*/}" green
+            log_file "INFO" "Backup skipped: ${dir##*/} is identical to $voice_path"
+            return 0
+        fi
+        break
+    done < <(ls -dt "$BACKUP_ROOT"/*/ 2>/dev/null)
+
     ensure_dir "$backup_path/voice_module"
     status "  Backing up voice module..." cyan
-    cp -r "$voice_path"/* "$backup_path/voice_module/" 2>/dev/null
+    clone_copy "$voice_path"/* "$backup_path/voice_module/" 2>/dev/null
 
     if ! backup_has_content "$backup_path"; then
         status "  [!] Backup validation failed" orange
@@ -808,10 +880,10 @@ list_backups() {
         validation=$(validate_backup_integrity "$dir")
         [[ "${validation%%|*}" == "VALID" ]] || continue
 
+        # All three fields in one jq call
         local cn av bd
-        cn=$(jq -r '.ClientName // "Unknown"' "$meta" 2>/dev/null || echo "Unknown")
-        av=$(jq -r '.AppVersion // "?"' "$meta" 2>/dev/null || echo "?")
-        bd=$(jq -r '.BackupDate // "?"' "$meta" 2>/dev/null || echo "?")
+        IFS='|' read -r cn av bd < <(jq -r '"\(.ClientName // "Unknown")|\(.AppVersion // "?")|\(.BackupDate // "?")"' \
+            "$meta" 2>/dev/null) || true
         local bd_fmt
         bd_fmt=$(date -d "$bd" '+%b %d, %Y %H:%M' 2>/dev/null || echo "$bd")
         echo "ORIGINAL|$dir|$cn|$av|$bd_fmt"
@@ -829,9 +901,8 @@ list_backups() {
         [[ "${validation%%|*}" == "VALID" ]] || continue
 
         local cn av bd
-        cn=$(jq -r '.ClientName // "Unknown"' "$meta" 2>/dev/null || echo "Unknown")
-        av=$(jq -r '.AppVersion // "?"' "$meta" 2>/dev/null || echo "?")
-        bd=$(jq -r '.BackupDate // "?"' "$meta" 2>/dev/null || echo "?")
+        IFS='|' read -r cn av bd < <(jq -r '"\(.ClientName // "Unknown")|\(.AppVersion // "?")|\(.BackupDate // "?")"' \
+            "$meta" 2>/dev/null) || true
         local bd_fmt
         bd_fmt=$(date -d "$bd" '+%b %d, %Y %H:%M' 2>/dev/null || echo "$bd")
         echo "BACKUP|$dir|$cn|$av|$bd_fmt"
@@ -871,7 +942,7 @@ restore_from_backup() {
         ensure_dir "$target_voice_path"
     fi
 
-    cp -r "$voice_backup"/* "$target_voice_path"/
+    clone_copy "$voice_backup"/* "$target_voice_path"/
 
     local restored_count
     restored_count=$(find "$target_voice_path" -type f 2>/dev/null | wc -l)
@@ -889,6 +960,7 @@ restore_from_backup() {
 download_voice_files() {
     local dest_path="$1"
     local max_retries=3
+    DOWNLOAD_COMPLETE=false
 
     for (( attempt=1; attempt<=max_retries; attempt++ )); do
         if [[ $attempt -gt 1 ]]; then
@@ -934,13 +1006,12 @@ download_voice_files() {
         local failed_files=()
         local total_bytes=0
 
-        # Parse JSON array of files
-        local file_names file_urls file_sizes
-        file_names=$(echo "$api_response" | jq -r '.[] | select(.type == "file") | .name' 2>/dev/null || true)
-        file_urls=$(echo "$api_response" | jq -r '.[] | select(.type == "file") | .download_url' 2>/dev/null || true)
-        file_sizes=$(echo "$api_response" | jq -r '.[] | select(.type == "file") | .size' 2>/dev/null || true)
+        # Parse JSON array of files in a single jq pass: name<TAB>url<TAB>size
+        # (size is last so an empty/null value can't shift the other fields)
+        local file_list
+        file_list=$(echo "$api_response" | jq -r '.[] | select(.type == "file") | [.name, .download_url, .size] | @tsv' 2>/dev/null || true)
 
-        if [[ -z "$file_names" ]]; then
+        if [[ -z "$file_list" ]]; then
             if [[ $attempt -lt $max_retries ]]; then
                 status "  [!] Empty response, retrying..." orange
                 continue
@@ -949,11 +1020,14 @@ download_voice_files() {
             return 1
         fi
 
-        local expected_count
-        expected_count=$(echo "$file_names" | wc -l)
-        status "  Found $expected_count file(s) to download" cyan
+        local -a file_rows=()
+        mapfile -t file_rows <<< "$file_list"
+        status "  Found ${#file_rows[@]} file(s) to download" cyan
 
-        while IFS= read -r fname && IFS= read -r furl <&3 && IFS= read -r fexpected_size <&4; do
+        local row
+        for row in "${file_rows[@]}"; do
+            local fname furl fexpected_size
+            IFS=$'\t' read -r fname furl fexpected_size <<< "$row"
             local fpath="$dest_path/$fname"
 
             if curl -sS --fail -L -o "$fpath" "$furl" 2>/dev/null; then
@@ -1000,7 +1074,7 @@ download_voice_files() {
                 status "  [!] Failed to download $fname" orange
                 failed_files+=("$fname")
             fi
-        done < <(echo "$file_names") 3< <(echo "$file_urls") 4< <(echo "$file_sizes")
+        done
 
         if [[ $file_count -eq 0 ]]; then
             if [[ $attempt -lt $max_retries ]]; then
@@ -1025,6 +1099,7 @@ download_voice_files() {
             total_fmt="$(( total_bytes / 1024 )) KB"
         fi
 
+        [[ ${#failed_files[@]} -eq 0 ]] && DOWNLOAD_COMPLETE=true
         status "  [OK] Downloaded $file_count file(s) ($total_fmt total)" green
         return 0
     done
@@ -1033,8 +1108,11 @@ download_voice_files() {
 }
 
 # --- Verify Fix Status ------------------------------------------------------
+# Optional 3rd arg: node hash from find_discord_clients (diagnostics passes it
+# via cached_node_hash while the file is unchanged), so the ~80MB module isn't
+# re-hashed right after the scan
 verify_fix() {
-    local voice_path="$1" client_name="$2"
+    local voice_path="$1" client_name="$2" known_hash="${3:-}"
     local sname
     sname=$(sanitize_name "$client_name")
     local orig_path="$ORIGINAL_BACKUP_ROOT/$sname/voice_module"
@@ -1046,8 +1124,10 @@ verify_fix() {
         return
     fi
 
-    local current_hash current_size
-    current_hash=$(md5sum "$node_file" 2>/dev/null | cut -d' ' -f1 || true)
+    local current_hash="$known_hash" current_size
+    if [[ -z "$current_hash" ]]; then
+        current_hash=$(md5sum "$node_file" 2>/dev/null | cut -d' ' -f1 || true)
+    fi
     current_size=$(stat -c%s "$node_file" 2>/dev/null || echo "0")
 
     # Check for zero-size corruption
@@ -1065,8 +1145,12 @@ verify_fix() {
         local orig_node
         orig_node=$(find "$orig_path" -name "*.node" -type f 2>/dev/null | head -1 || true)
         if [[ -n "$orig_node" ]]; then
+            # Original backup records its node hash in metadata.json at creation
             local orig_hash
-            orig_hash=$(md5sum "$orig_node" 2>/dev/null | cut -d' ' -f1 || true)
+            orig_hash=$(jq -r '.NodeHash // empty' "$ORIGINAL_BACKUP_ROOT/$sname/metadata.json" 2>/dev/null || true)
+            if [[ -z "$orig_hash" || "$orig_hash" == "unknown" ]]; then
+                orig_hash=$(md5sum "$orig_node" 2>/dev/null | cut -d' ' -f1 || true)
+            fi
             if [[ "$current_hash" == "$orig_hash" ]]; then
                 echo "NOTFIXED|Original mono modules detected|$current_hash|$current_size"
                 return
@@ -1083,12 +1167,13 @@ verify_fix() {
 # --- Script Self-Update Check ------------------------------------------------
 check_script_update() {
     status "Checking for script updates..." blue
-    local tmp_script
-    tmp_script=$(mktemp)
 
-    if curl -sS --fail -L -o "$tmp_script" "$UPDATE_URL" 2>/dev/null; then
-        local remote_version
-        remote_version=$(grep '^SCRIPT_VERSION=' "$tmp_script" 2>/dev/null | head -1 | cut -d'"' -f2 || true)
+    # Only the version line is needed, so the script is read into memory
+    # and matched in-shell rather than via a temp file + grep | cut
+    local remote_script
+    if remote_script=$(curl -sS --fail -L "$UPDATE_URL" 2>/dev/null); then
+        local remote_version="" re=$'(^|\n)SCRIPT_VERSION="([^"]*)"'
+        [[ "$remote_script" =~ $re ]] && remote_version="${BASH_REMATCH[2]}"
 
         if [[ -n "$remote_version" ]] && [[ "$remote_version" != "$SCRIPT_VERSION" ]]; then
             status "[!] Script update available: v$SCRIPT_VERSION -> v$remote_version" yellow
@@ -1096,7 +1181,6 @@ check_script_update() {
             echo -e "  Download from:"
             echo -e "  ${CYAN}${UNDERLINE}${UPDATE_URL}${NC}"
             echo ""
-            rm -f "$tmp_script"
             return 0
         else
             status "[OK] Script is up to date (v$SCRIPT_VERSION)" green
@@ -1105,11 +1189,28 @@ check_script_update() {
         status "  [!] Could not check for updates" orange
     fi
 
-    rm -f "$tmp_script"
     return 1
 }
 
 # --- Fix a Single Client -----------------------------------------------------
+# Returns 0 if every downloaded file is already installed byte-for-byte and
+# the download includes the .node itself - the small files alone match stock
+# Discord, so without the .node a match proves nothing.
+# Always checks what is on disk now (Discord can swap its module back between
+# menu actions); cmp stops at the first difference, so a mismatch is cheap.
+voice_module_matches() {
+    local download_path="$1" voice_path="$2"
+    local f fname has_node=false
+    for f in "$download_path"/*; do
+        [[ -f "$f" ]] || continue
+        fname="${f##*/}"
+        [[ -f "$voice_path/$fname" ]] || return 1
+        cmp -s "$f" "$voice_path/$fname" || return 1
+        [[ "$fname" == *.node ]] && has_node=true
+    done
+    $has_node
+}
+
 fix_client() {
     local idx="$1" download_path="$2"
     local name="${CLIENT_NAMES[$idx]}"
@@ -1122,6 +1223,18 @@ fix_client() {
     status "  Version: v$version" cyan
     status "  Voice module: $voice_path" dim
 
+    # Already installed: skip the backup + clear + copy of the whole module.
+    # Extra files in the voice folder are left alone on this path. Only
+    # trusted when the download had no failed files.
+    if $DOWNLOAD_COMPLETE && voice_module_matches "$download_path" "$voice_path"; then
+        local node_info
+        node_info=$(get_node_info "$voice_path")
+        save_fix_state "$name" "$version" "${node_info%%|*}"
+        status "[OK] $name already has the stereo module installed (skipped copy)" limegreen
+        log_file "INFO" "Skipped: $name v$version already matches downloaded module"
+        return 0
+    fi
+
     # Backup
     status "  Creating backup..." cyan
     create_voice_backup "$voice_path" "$name" "$version" || true
@@ -1149,7 +1262,7 @@ fix_client() {
     fi
 
     status "  Copying module files..." cyan
-    cp -r "$download_path"/* "$voice_path"/
+    clone_copy "$download_path"/* "$voice_path"/
 
     # Verify copy
     local copied_count
@@ -1248,12 +1361,13 @@ run_diagnostics() {
             echo -e "    App path:    ${CLIENT_APP_PATHS[$i]}"
             echo -e "    Voice path:  ${CLIENT_VOICE_PATHS[$i]}"
 
-            local node_file
+            local node_file fhash=""
             node_file=$(find "${CLIENT_VOICE_PATHS[$i]}" -name "*.node" -type f 2>/dev/null | head -1 || true)
             if [[ -n "$node_file" ]]; then
-                local fsize fhash
+                local fsize
                 fsize=$(stat -c%s "$node_file" 2>/dev/null || echo "0")
-                fhash=$(md5sum "$node_file" 2>/dev/null | cut -d' ' -f1 || true)
+                fhash=$(cached_node_hash "$i" "$node_file")
+                [[ -n "$fhash" ]] || fhash=$(md5sum "$node_file" 2>/dev/null | cut -d' ' -f1 || true)
                 local size_fmt
                 if [[ $fsize -gt 1048576 ]]; then
                     size_fmt="$(echo "scale=1; $fsize / 1048576" | bc 2>/dev/null || echo "$(( fsize / 1048576 ))") MB"
@@ -1272,7 +1386,7 @@ run_diagnostics() {
 
             # Check fix status
             local result
-            result=$(verify_fix "${CLIENT_VOICE_PATHS[$i]}" "${CLIENT_NAMES[$i]}")
+            result=$(verify_fix "${CLIENT_VOICE_PATHS[$i]}" "${CLIENT_NAMES[$i]}" "$fhash")
             local rstatus="${result%%|*}"
             case "$rstatus" in
                 FIXED)    echo -e "    Fix status:  ${GREEN}STEREO ACTIVE${NC}" ;;
@@ -1579,7 +1693,6 @@ run_interactive() {
     check_dependencies
     ensure_app_dirs
     load_settings
-    rotate_log
 
     log_file "INFO" "Starting interactive mode v$SCRIPT_VERSION"
 
@@ -1749,7 +1862,6 @@ menu_fix_single() {
     else
         status "[!] Some processes may still be running, continuing anyway..." orange
     fi
-    sleep 1
 
     # Fix
     if fix_client "$idx" "$download_path"; then
@@ -1814,7 +1926,6 @@ menu_fix_all() {
         else
             status "[!] Some processes may still be running, continuing..." orange
         fi
-        sleep 1
     fi
 
     # Fix all
@@ -1928,6 +2039,10 @@ menu_check_updates() {
 # ==============================================================================
 #  ENTRY POINT
 # ==============================================================================
+# Rotate before any mode runs; --silent is the mode meant for unattended
+# repeat runs, so it's the one most likely to grow the log without bound.
+rotate_log
+
 if $DIAG_MODE; then
     run_diagnostics
 elif $CLEANUP_MODE; then
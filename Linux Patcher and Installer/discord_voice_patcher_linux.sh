@@ -27,6 +27,7 @@ BITRATE=512
 CACHE_DIR="$HOME/.cache/DiscordVoicePatcher"
 BACKUP_DIR="$CACHE_DIR/Backups"
 LOG_FILE="$CACHE_DIR/patcher.log"
+VERIFY_CACHE="$CACHE_DIR/verified.cache"
 TEMP_DIR="$CACHE_DIR/build"
 
 # --- Build fingerprint (update when targeting a new Discord build) ------------
@@ -181,9 +182,24 @@ find_discord_clients() {
 
         if [[ ! -d "$base" ]]; then continue; fi
 
-        # Find discord_voice.node inside app-*/modules/discord_voice*/discord_voice/
+        # Find discord_voice.node inside <version>/modules/discord_voice*/[discord_voice/]
+        # Probe the known layout directly instead of walking the whole config
+        # dir (Cache, IndexedDB, ...); fall back to a bounded find.
         local found_nodes
-        found_nodes=$(find "$base" -maxdepth 5 -name "discord_voice.node" -type f 2>/dev/null | head -5 || true)
+        local -a probed=()
+        local nullglob_state
+        nullglob_state=$(shopt -p nullglob || true)
+        shopt -s nullglob
+        probed=(
+            "$base"/*/modules/discord_voice*/discord_voice/discord_voice.node
+            "$base"/*/modules/discord_voice*/discord_voice.node
+        )
+        eval "$nullglob_state"
+        if [[ ${#probed[@]} -gt 0 ]]; then
+            found_nodes=$(printf '%s\n' "${probed[@]}")
+        else
+            found_nodes=$(find "$base" -maxdepth 5 -name "discord_voice.node" -type f 2>/dev/null | head -5 || true)
+        fi
 
         if [[ -z "$found_nodes" ]]; then continue; fi
 
@@ -238,6 +254,18 @@ verify_binary() {
         return 1
     fi
 
+    # Hashing ~85MB is the slow part; skip it when the file is unchanged
+    # (same inode, size, mtime and ctime to the nanosecond) since it last
+    # hashed to EXPECTED_MD5. Any rewrite, including our own patch, bumps
+    # ctime and forces a fresh hash.
+    local stat_key entry
+    stat_key=$(stat -c '%d:%i %s %y %z' "$node_path" 2>/dev/null || true)
+    entry="$EXPECTED_MD5|$stat_key|$node_path"
+    if [[ -n "$stat_key" && -f "$VERIFY_CACHE" ]] && grep -qxF -- "$entry" "$VERIFY_CACHE"; then
+        log_ok "Binary verified (unchanged since last hash check)"
+        return 0
+    fi
+
     # MD5 check
     local actual_md5
     if command -v md5sum &>/dev/null; then
@@ -264,6 +292,18 @@ verify_binary() {
         return 1
     fi
 
+    # Remember the verdict, replacing any older entry for this path
+    if [[ -n "$stat_key" ]]; then
+        local line
+        local -a kept=()
+        if [[ -f "$VERIFY_CACHE" ]]; then
+            while IFS= read -r line; do
+                [[ "${line#*|*|}" == "$node_path" ]] || kept+=("$line")
+            done < "$VERIFY_CACHE"
+        fi
+        printf '%s\n' "${kept[@]}" "$entry" > "$VERIFY_CACHE" 2>/dev/null || true
+    fi
+
     log_ok "Binary verified (hash matches)"
     return 0
 }
@@ -298,7 +338,13 @@ backup_node() {
     fi
 
     local backup_path="$BACKUP_DIR/discord_voice.node.${sanitized}.$(date +%Y%m%d_%H%M%S).backup"
-    cp "$source" "$backup_path"
+    # Copy-on-write clone where the filesystem supports it (btrfs/XFS), so the
+    # ~85MB backup costs no data copy; --reflink=auto copies normally elsewhere
+    if ! cp --reflink=auto "$source" "$backup_path"; then
+        log_error "Backup copy failed: $backup_path"
+        rm -f "$backup_path"
+        return 1
+    fi
     log_ok "Backup: $(basename "$backup_path")"
 
     # Prune old backups per client (keep 3 - ~225MB for a 75MB node)
@@ -327,11 +373,10 @@ restore_from_backup() {
 
     for i in "${!backups[@]}"; do
         local bk="${backups[$i]}"
-        local bsize
-        bsize=$(stat -c%s "$bk" 2>/dev/null || echo "?")
-        local bdate
-        bdate=$(stat -c%y "$bk" 2>/dev/null | cut -d. -f1 || echo "unknown")
-        echo -e "  [$(( i + 1 ))] ${bdate} - $(numfmt --to=iec "$bsize" 2>/dev/null || echo "$bsize") - $(basename "$bk")"
+        # Size and date from one stat per backup; each entry falls back on its own
+        local bsize bday btime
+        read -r bsize bday btime _ < <(stat -c '%s %y' "$bk" 2>/dev/null || echo "? unknown")
+        echo -e "  [$(( i + 1 ))] ${bday}${btime:+ ${btime%.*}} - $(numfmt --to=iec "$bsize" 2>/dev/null || echo "$bsize") - ${bk##*/}"
     done
     echo ""
 
@@ -368,6 +413,7 @@ restore_from_backup() {
 # --- Compiler Detection ------------------------------------------------------
 COMPILER=""
 COMPILER_TYPE=""
+declare -a PATCHER_DEFINES=()
 
 find_compiler() {
     log_info "Searching for C++ compiler..."
@@ -392,6 +438,10 @@ find_compiler() {
 }
 
 # --- Source Code Generation --------------------------------------------------
+# These bodies are copied byte-for-byte into discord_voice.node, so they must
+# be position-independent with no .rodata references: the stores are volatile
+# because g++ otherwise merges the two -1 stores into one 8-byte load from a
+# rip-relative constant, which reads garbage once moved into Discord's binary.
 generate_amplifier_source() {
     local multiplier=$(( AUDIO_GAIN - 2 ))
     cat > "$TEMP_DIR/amplifier.cpp" << AMPEOF
@@ -402,20 +452,20 @@ generate_amplifier_source() {
 extern "C" void hp_cutoff(const float* in, int cutoff_Hz, float* out, int* hp_mem, int len, int channels, int Fs, int arch)
 {
     int* st = (hp_mem - 3553);
-    *(int*)(st + 3557) = 1002;
-    *(int*)((char*)st + 160) = -1;
-    *(int*)((char*)st + 164) = -1;
-    *(int*)((char*)st + 184) = 0;
+    *(volatile int*)(st + 3557) = 1002;
+    *(volatile int*)((char*)st + 160) = -1;
+    *(volatile int*)((char*)st + 164) = -1;
+    *(volatile int*)((char*)st + 184) = 0;
     for (unsigned long i = 0; i < (unsigned long)(channels * len); i++) out[i] = in[i] * (channels + Multiplier);
 }
 
 extern "C" void dc_reject(const float* in, float* out, int* hp_mem, int len, int channels, int Fs)
 {
     int* st = (hp_mem - 3553);
-    *(int*)(st + 3557) = 1002;
-    *(int*)((char*)st + 160) = -1;
-    *(int*)((char*)st + 164) = -1;
-    *(int*)((char*)st + 184) = 0;
+    *(volatile int*)(st + 3557) = 1002;
+    *(volatile int*)((char*)st + 160) = -1;
+    *(volatile int*)((char*)st + 164) = -1;
+    *(volatile int*)((char*)st + 184) = 0;
     for (int i = 0; i < channels * len; i++) out[i] = in[i] * (channels + Multiplier);
 }
 AMPEOF
@@ -484,16 +534,6 @@ private:
             return memcmp((char*)fileData + fileOffset, expected, len) == 0;
         };
 
-        auto PatchBytes = [&](uint32_t offset, const char* bytes, size_t len) -> bool {
-            uint32_t fileOffset = offset - Offsets::FILE_OFFSET_ADJUSTMENT;
-            if ((long long)(fileOffset + len) > fileSize) {
-                printf("ERROR: Patch at 0x%X (len %zu) exceeds file size!\n", offset, len);
-                return false;
-            }
-            memcpy((char*)fileData + fileOffset, bytes, len);
-            return true;
-        };
-
         // --- Pre-patch validation: check original bytes at key sites ---
         // Probe 3 sections spread across the binary to confirm this is the right build
         // Linux ELF original bytes (no PE header offset)
@@ -547,42 +587,58 @@ private:
             printf("  All validation checks PASSED.\n\n");
         }
 
-        printf("Applying patches...\n");
+        // Every write goes straight into a MAP_SHARED mapping of the file, so
+        // all sites are bounds-checked up front: a bad offset must fail before
+        // the first byte changes, not leave the file half-patched.
+        char gainStage[64];
+        snprintf(gainStage, sizeof(gainStage), "[4/5] Injecting audio processing (%dx gain)...", AUDIO_GAIN);
+
+        struct Patch { const char* stage; uint32_t offset; const char* bytes; size_t len; };
+        const Patch patches[] = {
+            {"[1/5] Enabling stereo audio...", Offsets::EmulateStereoSuccess1, "\x02", 1},
+            {nullptr, Offsets::EmulateStereoSuccess2, "\xEB", 1},
+            {nullptr, Offsets::CreateAudioFrameStereo, "\x49\x89\xC4\x90", 4},
+            {nullptr, Offsets::AudioEncoderOpusConfigSetChannels, "\x02", 1},
+            {nullptr, Offsets::MonoDownmixer, "\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\xE9", 13},
+
+            {"[2/5] Setting bitrate to 512kbps...", Offsets::EmulateBitrateModified, "\x00\xD0\x07", 3},
+            {nullptr, Offsets::SetsBitrateBitrateValue, "\x00\xD0\x07\x00\x00", 5},
+            {nullptr, Offsets::SetsBitrateBitwiseOr, "\x90\x90\x90", 3},
+            {nullptr, Offsets::DuplicateEmulateBitrateModified, "\x00\xD0\x07", 3},
+
+            {"[3/5] Enabling 48kHz sample rate...", Offsets::Emulate48Khz, "\x90\x90\x90", 3},
+
+            // HighPassFilter: ret (void function, safe)
+            {gainStage, Offsets::HighPassFilter, "\xC3", 1},
+            // Inject compiled hp_cutoff and dc_reject function bodies
+            {nullptr, Offsets::HighpassCutoffFilter, (const char*)hp_cutoff, 0x100},
+            {nullptr, Offsets::DcReject, (const char*)dc_reject, 0x1B6},
+            // DownmixFunc: ret (void function, safe)
+            {nullptr, Offsets::DownmixFunc, "\xC3", 1},
+            // AudioEncoderOpusConfigIsOk returns bool - must return TRUE (1)
+            // Using mov rax,1; ret (8 bytes) matching Windows patcher approach
+            {nullptr, Offsets::AudioEncoderOpusConfigIsOk, "\x48\xC7\xC0\x01\x00\x00\x00\xC3", 8},
+            // ThrowError: ret (prevents error throws from crashing)
+            {nullptr, Offsets::ThrowError, "\xC3", 1},
+
+            {"[5/5] Patching encoder config (512kbps at creation)...", Offsets::EncoderConfigInit1, "\x00\xD0\x07\x00", 4},
+            {nullptr, Offsets::EncoderConfigInit2, "\x00\xD0\x07\x00", 4},
+        };
 
-        printf("  [1/5] Enabling stereo audio...\n");
-        if (!PatchBytes(Offsets::EmulateStereoSuccess1, "\x02", 1)) return false;
-        if (!PatchBytes(Offsets::EmulateStereoSuccess2, "\xEB", 1)) return false;
-        if (!PatchBytes(Offsets::CreateAudioFrameStereo, "\x49\x89\xC4\x90", 4)) return false;
-        if (!PatchBytes(Offsets::AudioEncoderOpusConfigSetChannels, "\x02", 1)) return false;
-        if (!PatchBytes(Offsets::MonoDownmixer, "\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\x90\xE9", 13)) return false;
-
-        printf("  [2/5] Setting bitrate to 512kbps...\n");
-        if (!PatchBytes(Offsets::EmulateBitrateModified, "\x00\xD0\x07", 3)) return false;
-        if (!PatchBytes(Offsets::SetsBitrateBitrateValue, "\x00\xD0\x07\x00\x00", 5)) return false;
-        if (!PatchBytes(Offsets::SetsBitrateBitwiseOr, "\x90\x90\x90", 3)) return false;
-        if (!PatchBytes(Offsets::DuplicateEmulateBitrateModified, "\x00\xD0\x07", 3)) return false;
-
-        printf("  [3/5] Enabling 48kHz sample rate...\n");
-        if (!PatchBytes(Offsets::Emulate48Khz, "\x90\x90\x90", 3)) return false;
-
-        printf("  [4/5] Injecting audio processing (%dx gain)...\n", AUDIO_GAIN);
-        // HighPassFilter: ret (void function, safe)
-        if (!PatchBytes(Offsets::HighPassFilter, "\xC3", 1)) return false;
-        // Inject compiled hp_cutoff and dc_reject function bodies
-        if (!PatchBytes(Offsets::HighpassCutoffFilter, (const char*)hp_cutoff, 0x100)) return false;
-        if (!PatchBytes(Offsets::DcReject, (const char*)dc_reject, 0x1B6)) return false;
-        // DownmixFunc: ret (void function, safe)
-        if (!PatchBytes(Offsets::DownmixFunc, "\xC3", 1)) return false;
-        // AudioEncoderOpusConfigIsOk returns bool - must return TRUE (1)
-        // Using mov rax,1; ret (8 bytes) matching Windows patcher approach
-        if (!PatchBytes(Offsets::AudioEncoderOpusConfigIsOk,
-            "\x48\xC7\xC0\x01\x00\x00\x00\xC3", 8)) return false;
-        // ThrowError: ret (prevents error throws from crashing)
-        if (!PatchBytes(Offsets::ThrowError, "\xC3", 1)) return false;
-
-        printf("  [5/5] Patching encoder config (512kbps at creation)...\n");
-        if (!PatchBytes(Offsets::EncoderConfigInit1, "\x00\xD0\x07\x00", 4)) return false;
-        if (!PatchBytes(Offsets::EncoderConfigInit2, "\x00\xD0\x07\x00", 4)) return false;
+        for (const Patch& p : patches) {
+            uint32_t fileOffset = p.offset - Offsets::FILE_OFFSET_ADJUSTMENT;
+            if ((long long)(fileOffset + p.len) > fileSize) {
+                printf("ERROR: Patch at 0x%X (len %zu) exceeds file size!\n", p.offset, p.len);
+                printf("No changes were made to the file.\n");
+                return false;
+            }
+        }
+
+        printf("Applying patches...\n");
+        for (const Patch& p : patches) {
+            if (p.stage) printf("  %s\n", p.stage);
+            memcpy((char*)fileData + (p.offset - Offsets::FILE_OFFSET_ADJUSTMENT), p.bytes, p.len);
+        }
 
         printf("  All patches applied!\n");
         return true;
@@ -652,62 +708,85 @@ int main(int argc, char* argv[]) {
 }
 PATCHEOF
 
-    # Substitute values into the generated source.
-    # Using OFFSET_VAL_ prefix to avoid substring collisions
-    # (e.g. OFFSET_EmulateBitrateModified matching inside
-    # OFFSET_DuplicateEmulateBitrateModified).
-    sed -i "s/SAMPLERATE_VAL/$SAMPLE_RATE/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/BITRATE_VAL/$BITRATE/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/AUDIOGAIN_VAL/$AUDIO_GAIN/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_CreateAudioFrameStereo/${OFFSET_CreateAudioFrameStereo}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_AudioEncoderOpusConfigSetChannels/${OFFSET_AudioEncoderOpusConfigSetChannels}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_MonoDownmixer/${OFFSET_MonoDownmixer}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_EmulateStereoSuccess1/${OFFSET_EmulateStereoSuccess1}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_EmulateStereoSuccess2/${OFFSET_EmulateStereoSuccess2}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_EmulateBitrateModified/${OFFSET_EmulateBitrateModified}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_SetsBitrateBitrateValue/${OFFSET_SetsBitrateBitrateValue}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_SetsBitrateBitwiseOr/${OFFSET_SetsBitrateBitwiseOr}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_Emulate48Khz/${OFFSET_Emulate48Khz}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_HighPassFilter/${OFFSET_HighPassFilter}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_HighpassCutoffFilter/${OFFSET_HighpassCutoffFilter}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_DcReject/${OFFSET_DcReject}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_DownmixFunc/${OFFSET_DownmixFunc}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_AudioEncoderOpusConfigIsOk/${OFFSET_AudioEncoderOpusConfigIsOk}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_ThrowError/${OFFSET_ThrowError}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_DuplicateEmulateBitrateModified/${OFFSET_DuplicateEmulateBitrateModified}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_EncoderConfigInit1/${OFFSET_EncoderConfigInit1}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_EncoderConfigInit2/${OFFSET_EncoderConfigInit2}/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/OFFSET_VAL_FileAdjustment/$FILE_OFFSET_ADJUSTMENT/g" "$TEMP_DIR/patcher.cpp"
-
-    # Substitute original-byte validation arrays
-    sed -i "s/ORIG_VAL_Emulate48Khz/$ORIG_Emulate48Khz/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/ORIG_VAL_AudioEncoderOpusConfigIsOk/$ORIG_AudioEncoderOpusConfigIsOk/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/ORIG_VAL_DownmixFunc/$ORIG_DownmixFunc/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/ORIG_VAL_HighPassFilter/$ORIG_HighPassFilter/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/ORIG_VAL_HighpassCutoffFilter/$ORIG_HighpassCutoffFilter/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/ORIG_VAL_DcReject/$ORIG_DcReject/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/ORIG_VAL_EncoderConfigInit1/$ORIG_EncoderConfigInit1/g" "$TEMP_DIR/patcher.cpp"
-    sed -i "s/ORIG_VAL_EncoderConfigInit2/$ORIG_EncoderConfigInit2/g" "$TEMP_DIR/patcher.cpp"
+    # Values are passed to the compiler as -D defines rather than sed'ed
+    # into the source: patcher.cpp is emitted straight from the heredoc with
+    # no rewrite passes (compile_patcher saves the flags if a build fails).
+    PATCHER_DEFINES=(
+        "-DSAMPLERATE_VAL=$SAMPLE_RATE"
+        "-DBITRATE_VAL=$BITRATE"
+        "-DAUDIOGAIN_VAL=$AUDIO_GAIN"
+        "-DOFFSET_VAL_FileAdjustment=$FILE_OFFSET_ADJUSTMENT"
+    )
+    local site var
+    for site in CreateAudioFrameStereo AudioEncoderOpusConfigSetChannels MonoDownmixer \
+                EmulateStereoSuccess1 EmulateStereoSuccess2 EmulateBitrateModified \
+                SetsBitrateBitrateValue SetsBitrateBitwiseOr Emulate48Khz HighPassFilter \
+                HighpassCutoffFilter DcReject DownmixFunc AudioEncoderOpusConfigIsOk \
+                ThrowError DuplicateEmulateBitrateModified EncoderConfigInit1 EncoderConfigInit2; do
+        var="OFFSET_$site"
+        PATCHER_DEFINES+=("-DOFFSET_VAL_$site=${!var}")
+    done
+
+    # Original-byte validation arrays (brace initializers)
+    for site in Emulate48Khz AudioEncoderOpusConfigIsOk DownmixFunc HighPassFilter \
+                HighpassCutoffFilter DcReject EncoderConfigInit1 EncoderConfigInit2; do
+        var="ORIG_$site"
+        PATCHER_DEFINES+=("-DORIG_VAL_$site=${!var}")
+    done
 }
 
 # --- Compilation -------------------------------------------------------------
 compile_patcher() {
     # All log output goes to stderr so stdout is ONLY the exe path
+    # Sources depend only on gain + offsets, so when patching several clients
+    # the build is keyed on their content and reused instead of recompiled.
+    local key
+    key=$( { cat "$TEMP_DIR/patcher.cpp" "$TEMP_DIR/amplifier.cpp"; printf '%s\n' "${PATCHER_DEFINES[@]}"; } | md5sum | cut -c1-16)
+    local exe="$TEMP_DIR/DiscordVoicePatcher-$COMPILER-$key"
+    if [[ -x "$exe" ]]; then
+        log_ok "Reusing compiled patcher" >&2
+        echo "$exe"
+        return 0
+    fi
+
     log_info "Compiling patcher with $COMPILER_TYPE..." >&2
 
-    local exe="$TEMP_DIR/DiscordVoicePatcher"
-    rm -f "$exe"
+    # Each source is compiled on its own with -c and then linked: ccache (used
+    # when installed) only caches single-source -c compiles, never a combined
+    # compile+link, and its cache outlives cleanup's removal of our binaries.
+    # -pipe avoids intermediate temp files.
+    local -a cc=("$COMPILER")
+    if command -v ccache &>/dev/null; then
+        cc=(ccache "$COMPILER")
+        log_info "Using ccache" >&2
+    fi
 
-    # Compile both source files together with the C++ compiler
-    if ! $COMPILER -O2 -std=c++17 \
-        "$TEMP_DIR/patcher.cpp" \
-        "$TEMP_DIR/amplifier.cpp" \
-        -o "$exe" 2>"$TEMP_DIR/build.log"; then
+    if ! { "${cc[@]}" -O2 -std=c++17 -pipe "${PATCHER_DEFINES[@]}" \
+               -c "$TEMP_DIR/patcher.cpp" -o "$TEMP_DIR/patcher.o" &&
+           "${cc[@]}" -O2 -std=c++17 -pipe \
+               -c "$TEMP_DIR/amplifier.cpp" -o "$TEMP_DIR/amplifier.o" &&
+           "$COMPILER" "$TEMP_DIR/patcher.o" "$TEMP_DIR/amplifier.o" -o "$exe"; } 2>"$TEMP_DIR/build.log"; then
         log_error "Compilation failed! Build log:" >&2
         echo "" >&2
         cat "$TEMP_DIR/build.log" >&2
         echo "" >&2
-        log_info "Source files preserved in $TEMP_DIR for debugging" >&2
+        # The offsets/config live only in these flags, not in patcher.cpp
+        {
+            echo ""
+            echo "# patcher.cpp was compiled with these defines:"
+            printf '%s\n' "${PATCHER_DEFINES[@]}"
+        } >> "$TEMP_DIR/build.log"
+        log_info "Source files preserved in $TEMP_DIR for debugging (-D flags in build.log)" >&2
+        return 1
+    fi
+
+    # The amplifier bodies are copied raw into discord_voice.node, so any
+    # relocation in their .text (a rip-relative .rodata constant, a PLT call)
+    # would point at arbitrary bytes there. Refuse such a build outright.
+    if command -v objdump &>/dev/null && objdump -r -j .text "$TEMP_DIR/amplifier.o" 2>/dev/null | grep -q 'R_'; then
+        log_error "amplifier.o has relocations; its code is not safe to inject:" >&2
+        objdump -r -j .text "$TEMP_DIR/amplifier.o" >&2
+        rm -f "$exe"
         return 1
     fi
 
@@ -808,11 +887,11 @@ patch_client() {
 cleanup() {
     # Only clean up source/binary on success - preserve on failure for debugging
     if [[ "$PATCH_SUCCESS" == "true" ]]; then
-        rm -f "$TEMP_DIR/patcher.cpp" "$TEMP_DIR/amplifier.cpp" \
-              "$TEMP_DIR/DiscordVoicePatcher" 2>/dev/null
+        rm -f "$TEMP_DIR/patcher.cpp" "$TEMP_DIR/amplifier.cpp" "$TEMP_DIR"/*.o \
+              "$TEMP_DIR"/DiscordVoicePatcher* 2>/dev/null
     else
-        # Keep source + build log for debugging, just remove the binary
-        rm -f "$TEMP_DIR/DiscordVoicePatcher" 2>/dev/null
+        # Keep source + build log for debugging, just remove the binaries
+        rm -f "$TEMP_DIR"/*.o "$TEMP_DIR"/DiscordVoicePatcher* 2>/dev/null
     fi
 }
 